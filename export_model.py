@@ -0,0 +1,87 @@
+"""把拟合好的 SVC 导出为 app2.py 使用的 svm_model.npz / svm_model.json。
+
+重新训练模型或升级 sklearn 后运行一次即可：
+
+    python export_model.py svm_model.pkl
+
+svm_model.npz  : 拟合得到的数组（支持向量、对偶系数、截距等）
+svm_model.json : SVC 超参数（不含 probability）、拟合得到的标量，
+                 以及单独保存的 Platt 参数 "platt": {"A": ..., "B": ...}
+
+predictor.load_model() 按超参数构造 SVC 后把这些属性原样写回，
+因此导出的属性名必须与当前 sklearn 版本的 SVC 内部属性一致。
+"""
+import argparse
+import json
+
+import numpy as np
+from sklearn.svm import SVC
+
+
+def export_model(model, platt, npz_path="svm_model.npz", json_path="svm_model.json"):
+    """导出拟合好的 SVC；platt 为 (A, B)，即 Platt 缩放的两个参数。"""
+    params = model.get_params()
+    # probability 已在 sklearn 1.9 弃用，概率由 platt 参数在推理时换算
+    params.pop("probability", None)
+
+    # 构造函数本身就会设置的属性不需要导出，其余都是拟合得到的
+    init_attrs = vars(SVC(**params)).keys()
+    fitted = {
+        k: v for k, v in vars(model).items()
+        if k not in init_attrs and k != "feature_names_in_"
+    }
+
+    arrays = {k: v for k, v in fitted.items() if isinstance(v, np.ndarray) and v.ndim > 0}
+    # 与 probability=False 拟合的 SVC 一致：Platt 参数数组为空
+    arrays["_probA"] = np.empty(0, dtype=np.float64)
+    arrays["_probB"] = np.empty(0, dtype=np.float64)
+
+    scalars = {}
+    for k, v in fitted.items():
+        if k in arrays:
+            continue
+        if isinstance(v, (np.generic, np.ndarray)):
+            v = v.item()
+        elif isinstance(v, tuple):
+            v = list(v)
+        scalars[k] = v
+    if "_effective_probability" in scalars:
+        scalars["_effective_probability"] = False
+
+    np.savez(npz_path, **arrays)
+    spec = {
+        "params": params,
+        "fitted": scalars,
+        "platt": {"A": float(platt[0]), "B": float(platt[1])}
+    }
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(spec, f, indent=2)
+        f.write("\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export a fitted SVC to svm_model.npz / svm_model.json")
+    parser.add_argument("model", help="joblib/pickle file containing a fitted sklearn SVC")
+    parser.add_argument(
+        "--platt", nargs=2, type=float, metavar=("A", "B"),
+        help="Platt parameters; defaults to the model's own probA_/probB_ (probability=True)"
+    )
+    parser.add_argument("--npz", default="svm_model.npz")
+    parser.add_argument("--json", default="svm_model.json")
+    args = parser.parse_args()
+
+    # 只在离线导出时需要 joblib，应用本身不依赖它
+    import joblib
+
+    model = joblib.load(args.model)
+    if args.platt:
+        platt = args.platt
+    elif len(model._probA):
+        platt = (model._probA[0], model._probB[0])
+    else:
+        parser.error("model was fitted without probability=True; pass --platt A B")
+    export_model(model, platt, args.npz, args.json)
+
+
+if __name__ == "__main__":
+    main()
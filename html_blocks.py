@@ -0,0 +1,90 @@
+"""页面中的静态 HTML / CSS 片段。
+
+作为模块常量在首次导入时创建一次，Streamlit 重新执行 app2.py 时直接复用。
+"""
+
+
+# 页面样式：样式表由 Streamlit 静态文件服务提供（static/app.css），
+# 每次重新运行只需发送这一个 <link> 标签
+CSS_LINK = '<link rel="stylesheet" href="app/static/app.css">'
+
+
+# 标题
+TITLE_HTML = """
+    <div class="main-title">
+    🎗️ Breast Cancer 3-Year OS Prediction
+    </div>
+    <div class="subtitle">
+    🤖 An SVM-based Clinical Decision Support Tool
+    </div>
+    """
+
+
+# 简介卡片
+INTRO_HTML = """
+    <div class="card">
+    <b>ℹ️ Introduction</b><br><br>
+    This web-based calculator was developed using an optimized 
+    <b>Support Vector Machine (SVM)</b> model to estimate the 
+    <b>individualized 3-year overall survival (OS) probability</b> 
+    for breast cancer patients.<br><br>
+    
+    <i>This tool integrates clinicopathological parameters to assist in identifying high-risk patients.</i>
+    </div>
+    """
+
+
+# 预测结果卡片（{:.1f} 处填入百分比），后接高/低风险说明，一次 st.markdown 输出
+RESULT_CARD_HTML = """
+    <div class="card">
+    <b>📈 Predicted Probability of Poor Prognosis (3-Year OS)</b>
+    <div class="metric-value">{:.1f}%</div>
+    </div>
+    """
+
+
+HIGH_RISK_HTML = """
+    <div class="risk-high">
+    <b>🚨 High-Risk Group (Poor Prognosis)</b><br><br>
+    Patients in this group may benefit from:
+    <ul>
+        <li>💊 Intensified adjuvant therapy</li>
+        <li>🏥 Closer clinical surveillance</li>
+        <li>📆 More rigorous follow-up schedules</li>
+    </ul>
+    </div>
+    """
+
+
+LOW_RISK_HTML = """
+    <div class="risk-low">
+    <b>✅ Low-Risk Group (Favorable Prognosis)</b><br><br>
+    Patients in this group generally have a favorable prognosis 
+    under standard treatment.
+    </div>
+    """
+
+# 模型解释卡片
+INTERPRETATION_HTML = """
+    <div class="card">
+    <b>📊 Model Interpretation Summary</b><br><br>
+    The SVM model identified the following risk factors:
+    <ul>
+        <li>👵 Older age</li>
+        <li>🔬 Poor differentiation (Grade III)</li>
+        <li>📏 Advanced T stage</li>
+        <li>🦠 Positive lymph node status</li>
+        <li>🧬 Triple-negative subtype</li>
+        <li>🩸 Elevated NLR</li>
+    </ul>
+    </div>
+    """
+
+
+# 页脚
+FOOTER_HTML = """
+    <div class="footer">
+    © SVM-based Breast Cancer Survival Prediction Tool <br>
+    For research and clinical decision support only
+    </div>
+    """
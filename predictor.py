@@ -0,0 +1,227 @@
+"""SVM 模型加载与单样本推理（Numba JIT 编译的内核）。
+
+Streamlit 每次交互都会重新执行 app2.py，而被导入的模块只加载一次，
+因此编译好的内核放在这里，可以在多次运行之间复用。
+未安装 Numba 时退回等价的 NumPy 向量化实现。
+所有 NumPy / sklearn 相关的代码都集中在本模块，app2.py 只负责页面。
+"""
+import json
+import math
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+from sklearn.svm import SVC
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# libsvm 对概率输出的截断下限，与 SVC.predict_proba 保持一致
+MIN_PROB = 1e-7
+
+
+@njit(cache=True)
+def platt_proba(s, prob_a, prob_b):
+    """由决策值 s 得到正类 (classes_[1]) 的概率，结果与 SVC.predict_proba 一致。"""
+    # libsvm 内部的决策值与 sklearn 的 decision_function 符号相反
+    f = -s * prob_a + prob_b
+    if f >= 0.0:
+        r = math.exp(-f) / (1.0 + math.exp(-f))
+    else:
+        r = 1.0 / (1.0 + math.exp(f))
+    r = min(max(r, MIN_PROB), 1.0 - MIN_PROB)
+
+    # libsvm 的 multiclass_probability 在 k = 2 时并不直接返回 r，
+    # 而是从 (0.5, 0.5) 迭代到误差 < 0.005 / k 为止，这里逐步复现
+    q00 = (1.0 - r) * (1.0 - r)
+    q01 = -(1.0 - r) * r
+    q11 = r * r
+    p0 = 0.5
+    p1 = 0.5
+    for _ in range(100):
+        qp0 = q00 * p0 + q01 * p1
+        qp1 = q01 * p0 + q11 * p1
+        pqp = p0 * qp0 + p1 * qp1
+        if max(abs(qp0 - pqp), abs(qp1 - pqp)) < 0.0025:
+            break
+
+        diff = (pqp - qp0) / q00
+        p0 += diff
+        pqp = (pqp + diff * (diff * q00 + 2.0 * qp0)) / (1.0 + diff) / (1.0 + diff)
+        qp0 = (qp0 + diff * q00) / (1.0 + diff)
+        qp1 = (qp1 + diff * q01) / (1.0 + diff)
+        p0 /= 1.0 + diff
+        p1 /= 1.0 + diff
+
+        diff = (pqp - qp1) / q11
+        p1 += diff
+        pqp = (pqp + diff * (diff * q11 + 2.0 * qp1)) / (1.0 + diff) / (1.0 + diff)
+        qp0 = (qp0 + diff * q01) / (1.0 + diff)
+        qp1 = (qp1 + diff * q11) / (1.0 + diff)
+        p0 /= 1.0 + diff
+        p1 /= 1.0 + diff
+    return p1
+
+
+# linear_proba 接收折叠后的权重向量 coef (= dual_coef @ support_vectors)，
+# rbf_proba 仍需逐个支持向量计算核值
+if HAVE_NUMBA:
+    @njit(cache=True, fastmath=True)
+    def linear_proba(x, coef, intercept, prob_a, prob_b):
+        s = intercept
+        for j in range(coef.shape[0]):
+            s += coef[j] * x[j]
+        return platt_proba(s, prob_a, prob_b)
+
+    @njit(cache=True, fastmath=True)
+    def rbf_proba(x, sv, dual_coef, intercept, gamma, prob_a, prob_b):
+        # 距离与核值按输入精度计算（float32 输入即全程 float32），只有累加和 s 用 float64
+        s = 0.0
+        for i in range(sv.shape[0]):
+            d = sv.dtype.type(0.0)
+            for j in range(sv.shape[1]):
+                t = x[j] - sv[i, j]
+                d += t * t
+            s += dual_coef[i] * math.exp(-gamma * d)
+        return platt_proba(s + intercept, prob_a, prob_b)
+
+else:
+    def linear_proba(x, coef, intercept, prob_a, prob_b):
+        return platt_proba(np.dot(coef, x) + intercept, prob_a, prob_b)
+
+    def rbf_proba(x, sv, dual_coef, intercept, gamma, prob_a, prob_b):
+        # einsum 直接求每行平方和，不产生 diff ** 2 的临时数组
+        diff = sv - x
+        d2 = np.einsum("ij,ij->i", diff, diff)
+        s = np.dot(np.exp(-gamma * d2), dual_coef) + intercept
+        return platt_proba(s, prob_a, prob_b)
+
+
+def load_model(npz_path="svm_model.npz", json_path="svm_model.json"):
+    """从 npz（拟合得到的数组）和 json（超参数及拟合标量）还原 SVC。
+
+    返回 (model, platt)：model 不带 probability 校准，
+    platt 为离线拟合的 Platt 参数 {"A": ..., "B": ...}。
+    文件不存在时抛出 FileNotFoundError。
+    """
+    with np.load(npz_path) as npz:
+        arrays = dict(npz)
+    with open(json_path, encoding="utf-8") as f:
+        spec = json.load(f)
+
+    # 与反序列化 pickle 相同：先按超参数构造，再写回拟合属性
+    model = SVC(**spec["params"])
+    vars(model).update(spec["fitted"])
+    vars(model).update(arrays)
+    model.shape_fit_ = tuple(model.shape_fit_)
+    return model, spec["platt"]
+
+
+def build_predictor(model, platt):
+    """返回已预热的预测函数：输入一行特征值，输出正类概率。"""
+    sv = model.support_vectors_
+    dc = model.dual_coef_[0]
+    b = model.intercept_[0]
+    g = model._gamma
+    pa, pb = platt["A"], platt["B"]
+
+    # 输入行每次新建数组：预测函数被所有会话线程共享，不能共用缓冲区
+    if model.kernel == "linear":
+        # 线性核可把所有支持向量折叠成一个权重向量，推理只剩一次 6 维点积
+        coef = np.ascontiguousarray(model.coef_[0])
+
+        def predictor(row):
+            return linear_proba(np.array(row, dtype=np.float64), coef, b, pa, pb)
+
+        def decision_batch(X):
+            return X @ coef + b
+    elif model.kernel == "rbf":
+        # 非线性核每次都要扫描全部支持向量，用 float32 存储可减半内存带宽
+        sv32 = sv.astype(np.float32)
+        dc32 = dc.astype(np.float32)
+        g32 = np.float32(g)
+
+        def predictor(row):
+            return rbf_proba(np.array(row, dtype=np.float32), sv32, dc32, b, g32, pa, pb)
+
+        # 批量时用 |x|^2 - 2 x·sv + |sv|^2 把距离计算交给一次 GEMM；
+        # 这种展开在 float32 下抵消误差较大，因此使用 float64 原始数组
+        sv_sq = np.einsum("ij,ij->i", sv, sv)
+
+        def decision_batch(X):
+            d2 = np.einsum("ij,ij->i", X, X)[:, np.newaxis] - 2.0 * (X @ sv.T) + sv_sq
+            return np.exp(-g * np.maximum(d2, 0.0)) @ dc + b
+    else:
+        # 其他核函数交给 sklearn 计算决策值，再用 Platt 参数换算成概率
+        def predictor(row):
+            s = model.decision_function(np.array([row], dtype=np.float64))[0]
+            return platt_proba(s, pa, pb)
+
+        decision_batch = model.decision_function
+
+    # 预热：首次调用时完成 JIT 编译，避免由第一位用户承担
+    predictor((0.0,) * sv.shape[1])
+
+    # 多用户部署时设置 SVM_BATCHING=1，把并发会话的请求合并成批计算
+    if os.environ.get("SVM_BATCHING") == "1":
+        return BatchPredictor(
+            lambda X: [platt_proba(s, pa, pb) for s in decision_batch(X)]
+        )
+    return predictor
+
+
+class BatchPredictor:
+    """把并发提交的单行请求合并成一批，一次性计算决策值。
+
+    后台线程取到第一条请求后，最多再等待 max_wait 秒收集后续请求
+    （至多 max_batch 条），堆叠成矩阵统一计算，再把结果分发给各个请求。
+    单用户时每次预测都要多等 max_wait，因此默认不启用。
+    """
+
+    def __init__(self, proba_batch, max_batch=64, max_wait=0.02, timeout=5.0):
+        self._proba_batch = proba_batch
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._timeout = timeout
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def __call__(self, row):
+        future = Future()
+        self._queue.put((row, future))
+        # 后台线程意外退出时抛出 TimeoutError，而不是让会话一直阻塞
+        return future.result(timeout=self._timeout)
+
+    def _run(self):
+        while True:
+            pending = [self._queue.get()]
+            deadline = time.monotonic() + self._max_wait
+            while len(pending) < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(self._queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            # 整批的处理都放在 try 内：任何异常（包括输入行形状不一致）
+            # 都交给本批的各个请求，后台线程继续处理后续请求
+            try:
+                X = np.array([row for row, _ in pending], dtype=np.float64)
+                probs = self._proba_batch(X)
+            except Exception as e:
+                for _, future in pending:
+                    future.set_exception(e)
+            else:
+                for (_, future), prob in zip(pending, probs):
+                    future.set_result(prob)